@@ -96,6 +96,15 @@ func Server(cfg *config.Config, logger *slog.Logger) error {
 			return err
 		}
 
+		// 整个进程复用同一个连接，退出时关闭以完成 WAL checkpoint
+		defer func() {
+			if err := db.Close(); err != nil {
+				logger.Warn("关闭 SQLite 数据库失败",
+					"错误", err,
+				)
+			}
+		}()
+
 		jobRepo = storage.NewJobRepo(db, logger)
 
 		// 解析文件夹列表
@@ -110,6 +119,7 @@ func Server(cfg *config.Config, logger *slog.Logger) error {
 				jobRepo,
 				cfg.Collector.DiscoveryInterval,
 				folders,
+				cfg.Collector.CollectorConcurrency,
 				logger,
 			)
 		}, func(_ error) {
@@ -31,6 +31,9 @@ type JobCollector struct {
 	folders              []string      // 要获取的文件夹列表，如果为空则获取所有文件夹
 	cacheMutex           sync.RWMutex
 	lastCacheUpdate      time.Time
+	cachedJobs           []jenkins.Job // 已解析的缓存内容，避免每次抓取都重新读取并解析缓存文件
+	cachedModTime        time.Time     // cachedJobs 对应的缓存文件修改时间
+	cachedSize           int64         // cachedJobs 对应的缓存文件大小，与修改时间一起判断文件是否变化
 	stopCacheRefresh     chan struct{} // 用于停止定时刷新任务
 
 	Disabled        *prometheus.Desc
@@ -175,9 +178,6 @@ func (c *JobCollector) loadJobsFromCache() ([]jenkins.Job, bool, bool) {
 		return nil, false, false
 	}
 
-	c.cacheMutex.RLock()
-	defer c.cacheMutex.RUnlock()
-
 	// 检查缓存文件是否存在
 	info, err := os.Stat(c.cacheFile)
 	if err != nil {
@@ -188,23 +188,17 @@ func (c *JobCollector) loadJobsFromCache() ([]jenkins.Job, bool, bool) {
 		return nil, false, false
 	}
 
-	// 读取缓存文件
-	data, err := os.ReadFile(c.cacheFile)
-	if err != nil {
-		c.logger.Warn("读取缓存文件失败，将从 API 获取",
-			"缓存文件", c.cacheFile,
-			"错误", err,
-		)
-		return nil, false, false
-	}
-
-	var jobs []jenkins.Job
-	if err := json.Unmarshal(data, &jobs); err != nil {
-		c.logger.Warn("解析缓存文件失败，将从 API 获取",
-			"缓存文件", c.cacheFile,
-			"错误", err,
-		)
-		return nil, false, false
+	// 缓存文件未变化时直接复用已解析的结果，避免重复读取和 JSON 解析
+	c.cacheMutex.RLock()
+	jobs := c.cachedJobs
+	valid := c.cachedJobsValid(info)
+	c.cacheMutex.RUnlock()
+
+	if !valid {
+		var ok bool
+		if jobs, info, ok = c.reloadJobsCache(); !ok {
+			return nil, false, false
+		}
 	}
 
 	// 检查缓存是否过期
@@ -230,6 +224,59 @@ func (c *JobCollector) loadJobsFromCache() ([]jenkins.Job, bool, bool) {
 	return jobs, true, needsUpdate
 }
 
+// cachedJobsValid reports whether the parsed jobs in memory still match the cache file.
+// The caller must hold cacheMutex.
+func (c *JobCollector) cachedJobsValid(info os.FileInfo) bool {
+	return c.cachedJobs != nil &&
+		info.ModTime().Equal(c.cachedModTime) &&
+		info.Size() == c.cachedSize
+}
+
+// reloadJobsCache reads and parses the cache file under the write lock.
+// Returns (jobs, fileInfo, ok); ok is false if the file can't be read or parsed.
+func (c *JobCollector) reloadJobsCache() ([]jenkins.Job, os.FileInfo, bool) {
+	c.cacheMutex.Lock()
+	defer c.cacheMutex.Unlock()
+
+	info, err := os.Stat(c.cacheFile)
+	if err != nil {
+		c.logger.Debug("缓存文件不存在，将从 API 获取（首次运行或缓存文件被删除）",
+			"缓存文件", c.cacheFile,
+		)
+		return nil, nil, false
+	}
+
+	// 其他抓取可能已经在等待写锁期间完成了重新解析
+	if c.cachedJobsValid(info) {
+		return c.cachedJobs, info, true
+	}
+
+	// 读取缓存文件
+	data, err := os.ReadFile(c.cacheFile)
+	if err != nil {
+		c.logger.Warn("读取缓存文件失败，将从 API 获取",
+			"缓存文件", c.cacheFile,
+			"错误", err,
+		)
+		return nil, nil, false
+	}
+
+	var jobs []jenkins.Job
+	if err := json.Unmarshal(data, &jobs); err != nil {
+		c.logger.Warn("解析缓存文件失败，将从 API 获取",
+			"缓存文件", c.cacheFile,
+			"错误", err,
+		)
+		return nil, nil, false
+	}
+
+	c.cachedJobs = jobs
+	c.cachedModTime = info.ModTime()
+	c.cachedSize = info.Size()
+
+	return jobs, info, true
+}
+
 // saveJobsToCache saves jobs to cache file using atomic write.
 // It writes to a temporary file first, then atomically renames it to the target file.
 // This ensures that concurrent reads always see a complete file.
@@ -247,7 +294,8 @@ func (c *JobCollector) saveJobsToCache(jobs []jenkins.Job) error {
 		return fmt.Errorf("创建缓存目录失败: %w", err)
 	}
 
-	data, err := json.MarshalIndent(jobs, "", "  ")
+	// 使用紧凑 JSON，省去 MarshalIndent 的缩进处理并减小缓存文件体积
+	data, err := json.Marshal(jobs)
 	if err != nil {
 		return fmt.Errorf("序列化作业数据失败: %w", err)
 	}
@@ -271,6 +319,13 @@ func (c *JobCollector) saveJobsToCache(jobs []jenkins.Job) error {
 		return fmt.Errorf("重命名缓存文件失败: %w", err)
 	}
 
+	// 同步更新内存中的解析结果，下次加载无需再读取文件
+	if info, err := os.Stat(c.cacheFile); err == nil {
+		c.cachedJobs = jobs
+		c.cachedModTime = info.ModTime()
+		c.cachedSize = info.Size()
+	}
+
 	c.lastCacheUpdate = time.Now()
 	c.logger.Info("已保存作业列表到缓存文件（原子写入）",
 		"缓存文件", c.cacheFile,
@@ -429,22 +484,20 @@ func (c *JobCollector) Collect(ch chan<- prometheus.Metric) {
 	// 统计所有作业路径的前缀，用于调试
 	jobPathPrefixes := make(map[string]int)
 	// 统计所有作业路径，用于调试（只记录前20个，避免日志过长）
-	jobPaths := make([]string, 0)
+	jobPaths := make([]string, 0, min(len(jobs), 20))
 	for i, job := range jobs {
 		// job.Path 格式可能是 "uat/job-name" 或 "gray-uat-ebpay/gray-pre-asset-service-new"
-		parts := strings.Split(job.Path, "/")
-		if len(parts) > 0 {
-			topLevelFolder := parts[0]
-			folderJobCount[topLevelFolder]++
-			// 记录完整路径前缀（前两级）用于调试
-			if len(parts) >= 2 {
-				prefix := parts[0] + "/" + parts[1]
-				jobPathPrefixes[prefix]++
-			}
-			// 记录前20个作业路径用于调试
-			if i < 20 {
-				jobPaths = append(jobPaths, job.Path)
-			}
+		// 使用 strings.Cut 只截取前两级，避免为每个作业拆分完整路径
+		topLevelFolder, rest, nested := strings.Cut(job.Path, "/")
+		folderJobCount[topLevelFolder]++
+		// 记录完整路径前缀（前两级）用于调试
+		if nested {
+			secondLevel, _, _ := strings.Cut(rest, "/")
+			jobPathPrefixes[topLevelFolder+"/"+secondLevel]++
+		}
+		// 记录前20个作业路径用于调试
+		if i < 20 {
+			jobPaths = append(jobPaths, job.Path)
 		}
 	}
 
@@ -465,6 +518,8 @@ func (c *JobCollector) Collect(ch chan<- prometheus.Metric) {
 	processedCount := 0
 	buildDetailsFetched := 0
 	buildDetailsFailed := 0
+	// 进度日志最多输出约 10 次，避免作业很多时每 10 个作业就写一次日志
+	progressInterval := max(len(jobs)/10, 10)
 
 	// 如果启用构建详情获取，使用并行处理
 	if c.fetchBuildDetails {
@@ -531,7 +586,7 @@ func (c *JobCollector) Collect(ch chan<- prometheus.Metric) {
 		}()
 
 		// 收集结果并处理
-		buildDetailsMap := make(map[string]buildDetailResult)
+		buildDetailsMap := make(map[string]buildDetailResult, len(jobs))
 		for result := range resultsChan {
 			if result.buildErr == nil {
 				buildDetailsFetched++
@@ -544,8 +599,8 @@ func (c *JobCollector) Collect(ch chan<- prometheus.Metric) {
 
 		// 处理所有作业
 		for i, job := range jobs {
-			// 每处理10个作业记录一次进度
-			if i > 0 && i%10 == 0 {
+			// 每处理 progressInterval 个作业记录一次进度
+			if i > 0 && i%progressInterval == 0 {
 				c.logger.Info("正在处理作业",
 					"进度", fmt.Sprintf("%d/%d", i, len(jobs)),
 					"当前作业", job.Path,
@@ -674,8 +729,8 @@ func (c *JobCollector) Collect(ch chan<- prometheus.Metric) {
 	} else {
 		// 未启用构建详情获取，串行处理
 		for i, job := range jobs {
-			// 每处理10个作业记录一次进度
-			if i > 0 && i%10 == 0 {
+			// 每处理 progressInterval 个作业记录一次进度
+			if i > 0 && i%progressInterval == 0 {
 				c.logger.Info("正在处理作业",
 					"进度", fmt.Sprintf("%d/%d", i, len(jobs)),
 					"当前作业", job.Path,
@@ -0,0 +1,69 @@
+package exporter
+
+import (
+	"encoding/json"
+	"io"
+	"log/slog"
+	"os"
+	"path/filepath"
+	"testing"
+	"time"
+
+	"github.com/promhippie/jenkins_exporter/pkg/internal/jenkins"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func writeCacheFile(t *testing.T, path string, modTime time.Time, jobs ...jenkins.Job) {
+	t.Helper()
+
+	data, err := json.Marshal(jobs)
+	require.NoError(t, err)
+	require.NoError(t, os.WriteFile(path, data, 0644))
+	require.NoError(t, os.Chtimes(path, modTime, modTime))
+}
+
+func TestLoadJobsFromCache(t *testing.T) {
+	cacheFile := filepath.Join(t.TempDir(), "jobs.json")
+	modTime := time.Now().Truncate(time.Second)
+
+	c := &JobCollector{
+		logger:    slog.New(slog.NewTextHandler(io.Discard, nil)),
+		cacheFile: cacheFile,
+		cacheTTL:  time.Hour,
+	}
+
+	jobs, fromCache, _ := c.loadJobsFromCache()
+	assert.False(t, fromCache)
+	assert.Nil(t, jobs)
+
+	writeCacheFile(t, cacheFile, modTime, jenkins.Job{Path: "a"})
+
+	first, fromCache, needsUpdate := c.loadJobsFromCache()
+	require.True(t, fromCache)
+	assert.False(t, needsUpdate)
+	require.Len(t, first, 1)
+	assert.Equal(t, "a", first[0].Path)
+
+	// 文件未变化时复用已解析的结果
+	second, fromCache, _ := c.loadJobsFromCache()
+	require.True(t, fromCache)
+	require.Len(t, second, 1)
+	assert.Same(t, &first[0], &second[0])
+
+	// 修改时间相同但大小变化时重新解析
+	writeCacheFile(t, cacheFile, modTime, jenkins.Job{Path: "a"}, jenkins.Job{Path: "b"})
+
+	third, fromCache, _ := c.loadJobsFromCache()
+	require.True(t, fromCache)
+	require.Len(t, third, 2)
+	assert.Equal(t, "b", third[1].Path)
+
+	// 修改时间变化时重新解析
+	writeCacheFile(t, cacheFile, modTime.Add(time.Second), jenkins.Job{Path: "c"}, jenkins.Job{Path: "d"})
+
+	fourth, fromCache, _ := c.loadJobsFromCache()
+	require.True(t, fromCache)
+	require.Len(t, fourth, 2)
+	assert.Equal(t, "c", fourth[0].Path)
+}
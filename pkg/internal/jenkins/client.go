@@ -1,7 +1,6 @@
 package jenkins
 
 import (
-	"bytes"
 	"context"
 	"crypto/tls"
 	"crypto/x509"
@@ -113,14 +112,22 @@ func NewClient(options ...ClientOption) (*Client, error) {
 			timeout = 30 * time.Second // 默认30秒超时
 		}
 
+		// 基于 DefaultTransport 克隆，保留其拨号超时、TLS 握手超时和 HTTP/2 设置。
+		// SDK 共享该 Transport 且没有整体超时，这些超时可以避免连接阶段无限阻塞
+		transport := http.DefaultTransport.(*http.Transport).Clone()
+		transport.Proxy = http.ProxyFromEnvironment
+		transport.TLSClientConfig = &tls.Config{
+			RootCAs: pool,
+		}
+		// 所有请求都发往同一个 Jenkins，默认每个主机只保留 2 个空闲连接，
+		// 并发采集时会不断重建 TCP/TLS 连接，这里放大空闲连接池以复用连接
+		transport.MaxIdleConns = 100
+		transport.MaxIdleConnsPerHost = 32
+		transport.IdleConnTimeout = 90 * time.Second
+
 		client.httpClient = &http.Client{
-			Timeout: timeout,
-			Transport: &http.Transport{
-				Proxy: http.ProxyFromEnvironment,
-				TLSClientConfig: &tls.Config{
-					RootCAs: pool,
-				},
-			},
+			Timeout:   timeout,
+			Transport: transport,
 		}
 	}
 
@@ -142,7 +149,13 @@ func (c *Client) InitSDK(logger *slog.Logger) error {
 		return nil
 	}
 
-	sdk, err := NewSDKClient(c.endpoint, c.username, c.password, c.timeout, logger)
+	// SDK 与 REST 客户端共享同一个 Transport（连接池），不设置整体超时：
+	// 请求由 context 控制，连接建立阶段由 Transport 的拨号和 TLS 握手超时限制
+	httpClient := &http.Client{
+		Transport: c.httpClient.Transport,
+	}
+
+	sdk, err := NewSDKClient(httpClient, c.endpoint, c.username, c.password, c.timeout, logger)
 	if err != nil {
 		return err
 	}
@@ -184,7 +197,11 @@ func (c *Client) Do(req *http.Request, v interface{}) (*Response, error) {
 	res, err := c.httpClient.Do(req)
 
 	if res != nil {
-		defer func() { _ = res.Body.Close() }()
+		defer func() {
+			// 读完剩余内容再关闭，保证连接可以被复用
+			_, _ = io.Copy(io.Discard, res.Body)
+			_ = res.Body.Close()
+		}()
 	}
 
 	if err != nil {
@@ -195,23 +212,19 @@ func (c *Client) Do(req *http.Request, v interface{}) (*Response, error) {
 		c.httpDumper.DumpResponse(res)
 	}
 
-	body, err := io.ReadAll(res.Body)
-
-	if err != nil {
-		return &Response{Response: res}, err
-	}
-
-	res.Body = io.NopCloser(bytes.NewReader(body))
-
 	if res.StatusCode >= 400 && res.StatusCode <= 599 {
 		return &Response{Response: res}, errors.New(http.StatusText(res.StatusCode))
 	}
 
 	if v != nil {
 		if w, ok := v.(io.Writer); ok {
-			_, err = io.Copy(w, bytes.NewReader(body))
+			// 写入目标直接流式拷贝响应体，无需先缓冲完整响应
+			_, err = io.Copy(w, res.Body)
 		} else {
-			err = json.Unmarshal(body, v)
+			var body []byte
+			if body, err = io.ReadAll(res.Body); err == nil {
+				err = json.Unmarshal(body, v)
+			}
 		}
 	}
 
@@ -2,7 +2,6 @@ package jenkins
 
 import (
 	"context"
-	"errors"
 	"fmt"
 	"log/slog"
 	"strings"
@@ -144,10 +143,10 @@ func (c *BuildCollector) Start(ctx context.Context, interval time.Duration) erro
 	startTime := time.Now()
 
 	for i := 0; i < int(maxWaitTime/checkInterval); i++ {
-		jobs, err := c.repo.ListEnabledJobs()
+		stats, err := c.repo.Stats()
 		jobCount := 0
 		if err == nil {
-			jobCount = len(jobs)
+			jobCount = int(stats.Enabled)
 		}
 
 		if jobCount > 0 {
@@ -251,19 +250,14 @@ func (c *BuildCollector) collectOnceAsync(ctx context.Context) error {
 
 // isExcludedFolder checks if a job belongs to an excluded folder.
 func isExcludedFolder(jobName string) bool {
-	excludedFolders := map[string]bool{
-		"prod-ebpay-new":  true,
-		"pre-ebpay-new":   true,
-		"prod-gray-ebpay": true,
-	}
-
 	// 检查 job 路径的第一部分（顶层文件夹）是否在排除列表中
-	parts := strings.Split(jobName, "/")
-	if len(parts) > 0 {
-		topLevelFolder := parts[0]
-		return excludedFolders[topLevelFolder]
-	}
-	return false
+	return excludedFolders[topLevelFolder(jobName)]
+}
+
+// topLevelFolder returns the first path segment of a job name without splitting the whole path.
+func topLevelFolder(jobName string) string {
+	folder, _, _ := strings.Cut(jobName, "/")
+	return folder
 }
 
 // collectOnce performs a single collection cycle.
@@ -335,6 +329,8 @@ func (c *BuildCollector) collectOnce(ctx context.Context) error {
 	errorCount := 0
 	noBuildCount := 0
 	recentBuildCount := 0 // 最近有构建的 job 数量
+	// 进度日志最多输出约 10 次，避免 job 很多时每 10 个就写一次日志
+	progressInterval := max(len(jobs)/10, 10)
 
 	c.logger.Info("开始异步批量处理 job",
 		"总 job 数", len(jobs),
@@ -431,8 +427,8 @@ func (c *BuildCollector) collectOnce(ctx context.Context) error {
 			)
 		}
 
-		// 每处理 10 个 job 记录一次进度
-		if processedCount%10 == 0 {
+		// 每处理 progressInterval 个 job 记录一次进度
+		if processedCount%progressInterval == 0 {
 			c.logger.Info("处理进度",
 				"已处理", processedCount,
 				"总数", len(jobs),
@@ -448,13 +444,6 @@ func (c *BuildCollector) collectOnce(ctx context.Context) error {
 	// 2. 如果某个 job 不再存在，它的指标会在下次采集时自然消失（因为不会更新）
 	// 3. 这样可以避免在采集过程中指标为空的情况
 
-	// 清理不再存在的 job 的指标（在数据库中但不在当前 job 列表中的）
-	// 获取当前所有有效的 job 名称集合
-	validJobNames := make(map[string]bool)
-	for _, job := range filteredJobs {
-		validJobNames[job.JobName] = true
-	}
-
 	// 注意：Prometheus GaugeVec 没有直接的方法获取所有指标
 	// 但我们可以通过其他方式处理：在处理每个 job 时更新指标，不在列表中的自然会被覆盖或保留
 	// 实际上，由于我们在处理每个 job 时使用 DeletePartialMatch 删除旧指标，然后设置新指标
@@ -523,7 +512,7 @@ func (c *BuildCollector) processJob(ctx context.Context, job storage.Job) (*Proc
 	sdkBuild, buildNumber, err := c.client.SDK.GetLastCompletedBuild(ctx, job.JobName)
 	if err != nil {
 		// 如果是 context canceled，直接返回，不包装错误
-		if errors.Is(err, context.Canceled) || strings.Contains(err.Error(), "context canceled") {
+		if isCanceled(ctx, err) {
 			return nil, context.Canceled
 		}
 
@@ -567,7 +556,7 @@ func (c *BuildCollector) processJob(ctx context.Context, job storage.Job) (*Proc
 	buildDetails, err := c.client.SDK.GetBuildDetails(ctx, sdkBuild)
 	if err != nil {
 		// 如果是 context canceled，直接返回
-		if errors.Is(err, context.Canceled) || strings.Contains(err.Error(), "context canceled") {
+		if isCanceled(ctx, err) {
 			return nil, context.Canceled
 		}
 		c.logger.Warn("获取构建详情失败，使用基本信息",
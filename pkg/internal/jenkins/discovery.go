@@ -5,8 +5,10 @@ import (
 	"fmt"
 	"log/slog"
 	"strings"
+	"sync"
 	"time"
 
+	"github.com/bndr/gojenkins"
 	"github.com/promhippie/jenkins_exporter/pkg/internal/storage"
 )
 
@@ -34,16 +36,22 @@ func convertJobPathForSDK(fullName string) string {
 
 // StartDiscovery starts the job discovery process that periodically syncs job list from Jenkins to SQLite.
 // It runs at the specified interval (recommended: 5-10 minutes).
-func StartDiscovery(ctx context.Context, client *Client, repo *storage.JobRepo, interval time.Duration, folders []string, logger *slog.Logger) error {
+// concurrency limits the parallel folder probes per sync; values <= 0 fall back to 10.
+func StartDiscovery(ctx context.Context, client *Client, repo *storage.JobRepo, interval time.Duration, folders []string, concurrency int, logger *slog.Logger) error {
 	logger = logger.With("component", "discovery")
 
+	if concurrency <= 0 {
+		concurrency = 10 // 默认并发数
+	}
+
 	logger.Info("启动 Job Discovery",
 		"同步间隔", interval,
 		"指定文件夹", folders,
+		"并发数", concurrency,
 	)
 
 	// 立即执行一次同步
-	if err := syncJobsOnce(ctx, client, repo, folders, logger); err != nil {
+	if err := syncJobsOnce(ctx, client, repo, folders, concurrency, logger); err != nil {
 		logger.Warn("首次同步失败，将在下一个周期重试",
 			"错误", err,
 		)
@@ -60,7 +68,7 @@ func StartDiscovery(ctx context.Context, client *Client, repo *storage.JobRepo,
 			)
 			return ctx.Err()
 		case <-ticker.C:
-			if err := syncJobsOnce(ctx, client, repo, folders, logger); err != nil {
+			if err := syncJobsOnce(ctx, client, repo, folders, concurrency, logger); err != nil {
 				logger.Warn("Job 列表同步失败，将在下一个周期重试",
 					"错误", err,
 				)
@@ -71,7 +79,7 @@ func StartDiscovery(ctx context.Context, client *Client, repo *storage.JobRepo,
 }
 
 // syncJobsOnce performs a single synchronization of jobs from Jenkins to SQLite.
-func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, folders []string, logger *slog.Logger) error {
+func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, folders []string, concurrency int, logger *slog.Logger) error {
 	logger.Info("开始同步 Job 列表",
 		"指定文件夹", folders,
 		"说明", "正在从 Jenkins 获取 job 列表并同步到 SQLite 数据库",
@@ -97,13 +105,7 @@ func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, fo
 		"说明", "正在过滤文件夹和排除的文件夹...",
 	)
 
-	// 提取 job 名称（使用路径映射获取完整路径），并过滤掉排除的文件夹
-	excludedFolders := map[string]bool{
-		"prod-ebpay-new":  true,
-		"pre-ebpay-new":   true,
-		"prod-gray-ebpay":  true,
-	}
-	
+	// 提取 job 名称（使用路径映射获取完整路径），并过滤掉排除的文件夹（excludedFolders 定义在 sdk_client.go）
 	jobNames := make([]string, 0, len(sdkJobs))
 	excludedCount := 0
 	folderCount := 0
@@ -114,19 +116,26 @@ func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, fo
 		"说明", "正在逐个处理每个 job，过滤文件夹和排除的文件夹...",
 	)
 	
+	// 优先使用路径映射中的完整路径，如果没有则使用 GetName()
+	fullNames := make([]string, len(sdkJobs))
+	for i, job := range sdkJobs {
+		fullNames[i] = jobPathMap[job]
+		if fullNames[i] == "" {
+			fullNames[i] = job.GetName()
+		}
+	}
+
+	// 对无法通过 Class 判断类型的 job 并发调用 GetInnerJobs 探测是否为文件夹，
+	// 避免在下面的循环中逐个串行等待网络请求
+	probes := probeFolderJobs(ctx, sdkJobs, fullNames, concurrency, getInnerJobs)
+
 	processedCount := 0
 	validCount := 0
 	progressInterval := 50 // 每处理 50 个 job 输出一次进度
 	
 	for i, job := range sdkJobs {
 		processedCount = i + 1
-		// 优先使用路径映射中的完整路径，如果没有则使用 GetName()
-		fullName := jobPathMap[job]
-		if fullName == "" {
-			// 如果路径映射中没有，尝试使用 GetName()
-			fullName = job.GetName()
-		}
-		
+		fullName := fullNames[i]
 		if fullName == "" {
 			logger.Debug("跳过空名称的 job",
 				"job_info", fmt.Sprintf("%+v", job),
@@ -140,30 +149,20 @@ func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, fo
 		if job.Raw != nil {
 			jobClass := job.Raw.Class
 			if jobClass != "" {
-				if strings.Contains(jobClass, "Folder") || 
-				   strings.Contains(jobClass, "folder") ||
-				   strings.Contains(jobClass, "com.cloudbees.hudson.plugins.folder") {
+				if isFolderClass(jobClass) {
 					isFolder = true
 				}
 			}
 		}
 		
-		// 如果 Raw 为空或 Class 未设置，尝试通过 GetInnerJobs 来判断
-		// 注意：这会产生额外的 API 调用，但可以更准确地识别文件夹
-		if !isFolder && (job.Raw == nil || job.Raw.Class == "") {
-			// 创建子 context，避免超时影响整体
-			checkCtx, checkCancel := context.WithTimeout(ctx, 5*time.Second)
-			subJobs, err := job.GetInnerJobs(checkCtx)
-			checkCancel()
-			
-			if err == nil {
-				// 能成功调用 GetInnerJobs，说明是文件夹
-				isFolder = true
-				logger.Debug("在 Discovery 阶段检测到文件夹类型，跳过",
-					"job_name", fullName,
-					"子项数量", len(subJobs),
-				)
-			}
+		// 如果 Raw 为空或 Class 未设置，使用上面并发 GetInnerJobs 探测的结果来判断
+		if !isFolder && probes[i].isFolder {
+			// 能成功调用 GetInnerJobs，说明是文件夹
+			isFolder = true
+			logger.Debug("在 Discovery 阶段检测到文件夹类型，跳过",
+				"job_name", fullName,
+				"子项数量", probes[i].subJobs,
+			)
 		}
 		
 		if isFolder {
@@ -186,17 +185,13 @@ func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, fo
 		)
 		
 		// 检查是否是排除的文件夹下的 job
-		parts := strings.Split(fullName, "/")
-		if len(parts) > 0 {
-			topLevelFolder := parts[0]
-			if excludedFolders[topLevelFolder] {
-				excludedCount++
-				logger.Debug("过滤掉排除的文件夹下的 job",
-					"job_name", fullName,
-					"顶层文件夹", topLevelFolder,
-				)
-				continue
-			}
+		if folder := topLevelFolder(fullName); excludedFolders[folder] {
+			excludedCount++
+			logger.Debug("过滤掉排除的文件夹下的 job",
+				"job_name", fullName,
+				"顶层文件夹", folder,
+			)
+			continue
 		}
 		
 		// 将路径转换为 SDK 格式（folder/job -> folder/job/job）
@@ -262,11 +257,11 @@ func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, fo
 		return fmt.Errorf("failed to sync jobs to SQLite: %w", err)
 	}
 
-	// 获取同步后的统计信息（从数据库读取实际数量）
-	enabledJobs, err := repo.ListEnabledJobs()
+	// 获取同步后的统计信息（从数据库读取实际数量，单次聚合查询）
+	stats, err := repo.Stats()
 	enabledCount := 0
 	if err == nil {
-		enabledCount = len(enabledJobs)
+		enabledCount = int(stats.Enabled)
 	}
 
 	logger.Info("✅ Job 列表同步完成",
@@ -275,6 +270,7 @@ func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, fo
 			"已处理总数":            processedCount,
 			"有效 job 数量":         len(jobNames),
 			"数据库中的启用 job 数量": enabledCount,
+			"数据库中的禁用 job 数量": stats.Disabled,
 			"过滤掉的文件夹":         folderCount,
 			"过滤掉的排除文件夹":       excludedCount,
 		},
@@ -285,6 +281,63 @@ func syncJobsOnce(ctx context.Context, client *Client, repo *storage.JobRepo, fo
 	return nil
 }
 
+// folderProbe contains the result of probing a job for inner jobs.
+type folderProbe struct {
+	isFolder bool
+	subJobs  int
+}
+
+// innerJobsFunc fetches the inner jobs of a job; it fails for non-folder jobs.
+type innerJobsFunc func(ctx context.Context, job *gojenkins.Job) ([]*gojenkins.Job, error)
+
+// getInnerJobs is the innerJobsFunc backed by the gojenkins SDK.
+func getInnerJobs(ctx context.Context, job *gojenkins.Job) ([]*gojenkins.Job, error) {
+	return job.GetInnerJobs(ctx)
+}
+
+// probeFolderJobs concurrently calls innerJobs for jobs whose class is unknown.
+// fullNames must be aligned with sdkJobs; jobs with an empty name are skipped by the
+// caller, so they are not probed either. The returned slice is aligned with sdkJobs;
+// jobs that need no probe keep a zero value.
+func probeFolderJobs(ctx context.Context, sdkJobs []*gojenkins.Job, fullNames []string, concurrency int, innerJobs innerJobsFunc) []folderProbe {
+	probes := make([]folderProbe, len(sdkJobs))
+	semaphore := make(chan struct{}, concurrency)
+	var wg sync.WaitGroup
+
+	for i, job := range sdkJobs {
+		// 空名称的 job 会被直接跳过，无需探测
+		if fullNames[i] == "" {
+			continue
+		}
+
+		// 只有 Raw 为空或 Class 未设置时才需要额外的 API 调用
+		if job.Raw != nil && job.Raw.Class != "" {
+			continue
+		}
+
+		wg.Add(1)
+		go func(i int, job *gojenkins.Job) {
+			defer wg.Done()
+
+			// 获取信号量（控制并发数）
+			semaphore <- struct{}{}
+			defer func() { <-semaphore }()
+
+			// 创建子 context，避免超时影响整体
+			checkCtx, checkCancel := context.WithTimeout(ctx, 5*time.Second)
+			subJobs, err := innerJobs(checkCtx, job)
+			checkCancel()
+
+			if err == nil {
+				probes[i] = folderProbe{isFolder: true, subJobs: len(subJobs)}
+			}
+		}(i, job)
+	}
+
+	wg.Wait()
+	return probes
+}
+
 // GetJobNamesFromFolders extracts job names from a folder string (comma-separated).
 func GetJobNamesFromFolders(foldersStr string) []string {
 	if foldersStr == "" {
@@ -0,0 +1,50 @@
+package jenkins
+
+import (
+	"context"
+	"errors"
+	"sync"
+	"testing"
+
+	"github.com/bndr/gojenkins"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestProbeFolderJobs(t *testing.T) {
+	pipeline := &gojenkins.Job{Raw: &gojenkins.JobResponse{Class: "org.jenkinsci.plugins.workflow.job.WorkflowJob"}}
+	folder := &gojenkins.Job{}
+	unnamed := &gojenkins.Job{}
+	plain := &gojenkins.Job{}
+
+	sdkJobs := []*gojenkins.Job{pipeline, folder, unnamed, plain}
+	fullNames := []string{"pipeline", "uat", "", "uat/job"}
+
+	var mu sync.Mutex
+	probed := make(map[*gojenkins.Job]bool)
+
+	innerJobs := func(_ context.Context, job *gojenkins.Job) ([]*gojenkins.Job, error) {
+		mu.Lock()
+		probed[job] = true
+		mu.Unlock()
+
+		if job == folder {
+			return []*gojenkins.Job{{}, {}, {}}, nil
+		}
+
+		return nil, errors.New("not a folder")
+	}
+
+	probes := probeFolderJobs(context.Background(), sdkJobs, fullNames, 2, innerJobs)
+
+	assert.Equal(t, []folderProbe{
+		{},
+		{isFolder: true, subJobs: 3},
+		{},
+		{},
+	}, probes)
+
+	assert.Equal(t, map[*gojenkins.Job]bool{
+		folder: true,
+		plain:  true,
+	}, probed)
+}
@@ -103,7 +103,7 @@ func (c *JobClient) All(ctx context.Context, folders []string) ([]Job, error) {
 	// 如果指定了文件夹，只处理这些文件夹
 	if len(folders) > 0 {
 		// 创建文件夹名称到文件夹的映射
-		folderMap := make(map[string]Folder)
+		folderMap := make(map[string]Folder, len(hudson.Folders))
 		allTopLevelFolders := make([]string, 0)
 		for _, folder := range hudson.Folders {
 			folderMap[folder.Name] = folder
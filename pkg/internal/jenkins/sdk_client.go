@@ -5,6 +5,7 @@ import (
 	"errors"
 	"fmt"
 	"log/slog"
+	"net/http"
 	"strings"
 	"time"
 
@@ -18,9 +19,10 @@ type SDKClient struct {
 }
 
 // NewSDKClient creates a new SDK client.
-func NewSDKClient(endpoint, username, password string, timeout time.Duration, logger *slog.Logger) (*SDKClient, error) {
-	// 创建 gojenkins 实例
-	jenkins := gojenkins.CreateJenkins(nil, endpoint, username, password)
+// The given HTTP client is reused for all SDK requests so connections are kept alive.
+func NewSDKClient(httpClient *http.Client, endpoint, username, password string, timeout time.Duration, logger *slog.Logger) (*SDKClient, error) {
+	// 创建 gojenkins 实例（传入 nil 时 gojenkins 会使用 http.DefaultClient）
+	jenkins := gojenkins.CreateJenkins(httpClient, endpoint, username, password)
 
 	// 初始化连接（需要 context）
 	ctx, cancel := context.WithTimeout(context.Background(), timeout)
@@ -48,6 +50,27 @@ var excludedFolders = map[string]bool{
 	"prod-gray-ebpay":  true,
 }
 
+// folderClassPrefix is the class prefix of the CloudBees folder plugin types.
+const folderClassPrefix = "com.cloudbees.hudson.plugins.folder."
+
+// isFolderClass reports whether a Jenkins _class value denotes a folder type.
+// Folder plugin classes are matched by a cheap prefix compare first; the generic
+// substring checks are only reached for other classes.
+func isFolderClass(class string) bool {
+	return strings.HasPrefix(class, folderClassPrefix) ||
+		strings.Contains(class, "Folder") ||
+		strings.Contains(class, "folder")
+}
+
+// isCanceled reports whether err was caused by a canceled context.
+// The typed checks run first so the error message is only formatted for
+// errors from the SDK that do not wrap context.Canceled.
+func isCanceled(ctx context.Context, err error) bool {
+	return errors.Is(err, context.Canceled) ||
+		errors.Is(ctx.Err(), context.Canceled) ||
+		strings.Contains(err.Error(), "context canceled")
+}
+
 // JobWithPath wraps a gojenkins.Job with its full path.
 // This is needed because gojenkins.Job.GetName() may return relative names for nested jobs.
 type JobWithPath struct {
@@ -105,7 +128,7 @@ func (c *SDKClient) GetAllJobsRecursive(ctx context.Context, folderNames []strin
 			jobs, paths, err := c.recursiveGetJobsWithPathMap(ctx, job, jobName, jobPathMap, logger)
 			if err != nil {
 				// 如果是 context canceled，直接返回
-				if errors.Is(err, context.Canceled) || ctx.Err() == context.Canceled {
+				if isCanceled(ctx, err) {
 					return allJobs, jobPathMap, err
 				}
 				logger.Warn("递归获取 job 失败",
@@ -172,16 +195,12 @@ func (c *SDKClient) recursiveGetJobsWithPathMap(ctx context.Context, job *gojenk
 	
 	// 检查是否是排除的文件夹（检查完整路径中的任何部分）
 	// 例如：如果 jobName 是 "prod-gray-ebpay/some-job"，需要检查路径的第一部分
-	parts := strings.Split(jobName, "/")
-	if len(parts) > 0 {
-		topLevelFolder := parts[0]
-		if excludedFolders[topLevelFolder] {
-			logger.Debug("跳过排除的文件夹路径",
-				"job_name", jobName,
-				"顶层文件夹", topLevelFolder,
-			)
-			return allJobs, jobPathMap, nil // 返回空列表，不递归处理
-		}
+	if folder := topLevelFolder(jobName); excludedFolders[folder] {
+		logger.Debug("跳过排除的文件夹路径",
+			"job_name", jobName,
+			"顶层文件夹", folder,
+		)
+		return allJobs, jobPathMap, nil // 返回空列表，不递归处理
 	}
 
 	// 检查是否是文件夹类型
@@ -191,9 +210,7 @@ func (c *SDKClient) recursiveGetJobsWithPathMap(ctx context.Context, job *gojenk
 		jobClass := job.Raw.Class
 		if jobClass != "" {
 			// 检查是否包含 Folder 相关的类名
-			if strings.Contains(jobClass, "Folder") || 
-			   strings.Contains(jobClass, "folder") ||
-			   strings.Contains(jobClass, "com.cloudbees.hudson.plugins.folder") {
+			if isFolderClass(jobClass) {
 				isFolder = true
 				logger.Debug("检测到文件夹类型（通过 Class）",
 					"job_name", fullPath,
@@ -262,7 +279,7 @@ func (c *SDKClient) recursiveGetJobsWithPathMap(ctx context.Context, job *gojenk
 			jobs, paths, err := c.recursiveGetJobsWithPathMap(ctx, subJob, fullSubJobName, jobPathMap, logger)
 			if err != nil {
 				// 如果是 context canceled，直接返回
-				if errors.Is(err, context.Canceled) || ctx.Err() == context.Canceled {
+				if isCanceled(ctx, err) {
 					return allJobs, jobPathMap, err
 				}
 				logger.Debug("递归获取子 job 失败",
@@ -287,9 +304,7 @@ func (c *SDKClient) recursiveGetJobsWithPathMap(ctx context.Context, job *gojenk
 			jobClass := job.Raw.Class
 			if jobClass != "" {
 				// 检查是否包含 Folder 相关的类名（更严格的检查）
-				if strings.Contains(jobClass, "Folder") || 
-				   strings.Contains(jobClass, "folder") ||
-				   strings.Contains(jobClass, "com.cloudbees.hudson.plugins.folder") {
+				if isFolderClass(jobClass) {
 					isActuallyFolder = true
 					logger.Debug("检测到文件夹类型（在非文件夹分支），跳过",
 						"job_name", fullPath,
@@ -339,15 +354,6 @@ func (c *SDKClient) recursiveGetJobsWithPathMap(ctx context.Context, job *gojenk
 	return allJobs, jobPathMap, nil
 }
 
-// recursiveGetJobs recursively gets all jobs from a job (which might be a folder).
-// This is a wrapper that uses the job's GetName() and handles path construction.
-func (c *SDKClient) recursiveGetJobs(ctx context.Context, job *gojenkins.Job, logger *slog.Logger) ([]*gojenkins.Job, error) {
-	jobName := job.GetName()
-	jobPathMap := make(map[*gojenkins.Job]string)
-	jobs, _, err := c.recursiveGetJobsWithPathMap(ctx, job, jobName, jobPathMap, logger)
-	return jobs, err
-}
-
 // GetAllJobs returns all jobs recursively, optionally filtered by folder names.
 // It filters out folder-type jobs and only returns actual build jobs.
 // Deprecated: Use GetAllJobsRecursive instead.
@@ -388,22 +394,8 @@ func (c *SDKClient) GetAllJobs(ctx context.Context, folderNames []string) ([]*go
 			}
 		}
 		
-		// 方法2: 尝试获取构建信息，如果失败可能是文件夹
-		if !isFolder {
-			// 尝试获取最后一次构建，如果失败且是特定错误，可能是文件夹
-			_, err := job.GetLastCompletedBuild(ctx)
-			if err != nil {
-				errMsg := err.Error()
-				// 如果是 404 或找不到构建，可能是文件夹
-				if strings.Contains(errMsg, "404") || 
-				   strings.Contains(errMsg, "not found") ||
-				   strings.Contains(errMsg, "invalid character '<'") {
-					// 进一步检查：如果 job 没有构建历史，可能是文件夹
-					// 但有些 job 确实没有构建，所以不能完全依赖这个
-					// 主要依赖 class 字段判断
-				}
-			}
-		}
+		// 不再额外请求最后一次构建来辅助判断：其结果从未被使用，
+		// 只会为每个 job 多一次 HTTP 请求和 JSON 解析，判断完全依赖 class 字段
 		
 		// 如果不是文件夹，添加到结果列表
 		if !isFolder {
@@ -419,20 +411,15 @@ func (c *SDKClient) GetAllJobs(ctx context.Context, folderNames []string) ([]*go
 
 	// 如果指定了文件夹，进行过滤
 	if len(folderNames) > 0 {
-		folderSet := make(map[string]bool)
+		folderSet := make(map[string]bool, len(folderNames))
 		for _, name := range folderNames {
 			folderSet[name] = true
 		}
 
 		for _, job := range filteredJobs {
 			// 检查 job 是否在指定的文件夹下
-			fullName := job.GetName()
-			parts := strings.Split(fullName, "/")
-			if len(parts) > 0 {
-				topFolder := parts[0]
-				if folderSet[topFolder] {
-					allJobs = append(allJobs, job)
-				}
+			if folderSet[topLevelFolder(job.GetName())] {
+				allJobs = append(allJobs, job)
 			}
 		}
 	} else {
@@ -529,7 +516,7 @@ func (c *SDKClient) GetLastCompletedBuild(ctx context.Context, fullName string)
 	job, err := c.GetJobByFullName(ctx, fullName)
 	if err != nil {
 		// 如果是 context canceled，直接返回
-		if errors.Is(err, context.Canceled) || ctx.Err() == context.Canceled || strings.Contains(err.Error(), "context canceled") {
+		if isCanceled(ctx, err) {
 			return nil, 0, context.Canceled
 		}
 		return nil, 0, err
@@ -544,7 +531,7 @@ func (c *SDKClient) GetLastCompletedBuild(ctx context.Context, fullName string)
 	build, err := job.GetLastCompletedBuild(ctx)
 	if err != nil {
 		// 如果是 context canceled，直接返回
-		if errors.Is(err, context.Canceled) || ctx.Err() == context.Canceled || strings.Contains(err.Error(), "context canceled") {
+		if isCanceled(ctx, err) {
 			return nil, 0, context.Canceled
 		}
 		// 如果没有完成的构建，返回 nil
@@ -16,6 +16,13 @@ type Job struct {
 	CreatedAt     time.Time
 }
 
+// JobStats contains aggregated counters of the jobs table.
+type JobStats struct {
+	Total    int64
+	Enabled  int64
+	Disabled int64
+}
+
 // JobRepo provides methods for job data access.
 type JobRepo struct {
 	db     *sql.DB
@@ -30,15 +37,17 @@ func NewJobRepo(db *sql.DB, logger *slog.Logger) *JobRepo {
 	}
 }
 
+// listEnabledJobsQuery selects enabled jobs ordered by name; it is served by
+// idx_jobs_enabled_name without a temporary sort.
+const listEnabledJobsQuery = `
+	SELECT job_name, enabled, last_seen_build, last_sync_time, created_at
+	FROM jobs
+	WHERE enabled = 1
+	ORDER BY job_name`
+
 // ListEnabledJobs returns all enabled jobs from the database.
 func (r *JobRepo) ListEnabledJobs() ([]Job, error) {
-	query := `
-		SELECT job_name, enabled, last_seen_build, last_sync_time, created_at
-		FROM jobs
-		WHERE enabled = 1
-		ORDER BY job_name`
-
-	rows, err := r.db.Query(query)
+	rows, err := r.db.Query(listEnabledJobsQuery)
 	if err != nil {
 		return nil, fmt.Errorf("failed to query enabled jobs: %w", err)
 	}
@@ -78,6 +87,25 @@ func (r *JobRepo) ListEnabledJobs() ([]Job, error) {
 	return jobs, nil
 }
 
+// Stats returns the job counters using a single aggregated scan of the jobs table.
+func (r *JobRepo) Stats() (JobStats, error) {
+	var stats JobStats
+
+	query := `
+		SELECT COUNT(*), COALESCE(SUM(enabled), 0), COALESCE(SUM(1 - enabled), 0)
+		FROM jobs`
+
+	if err := r.db.QueryRow(query).Scan(
+		&stats.Total,
+		&stats.Enabled,
+		&stats.Disabled,
+	); err != nil {
+		return stats, fmt.Errorf("failed to query job stats: %w", err)
+	}
+
+	return stats, nil
+}
+
 // UpdateLastSeen updates the last_seen_build for a job.
 func (r *JobRepo) UpdateLastSeen(jobName string, buildNumber int64) error {
 	query := `
@@ -119,12 +147,18 @@ func (r *JobRepo) SyncJobs(jobNames []string) error {
 		jobNameSet[name] = true
 	}
 
-	// 获取当前数据库中的所有 enabled=1 的 job
-	existingJobs, err := r.listEnabledJobsInTx(tx)
+	// 单次扫描获取数据库中的所有 job 及启用的 job，替代逐个 job 的存在性查询
+	knownJobs, existingJobNames, err := r.listJobsInTx(tx)
 	if err != nil {
 		return fmt.Errorf("failed to list existing jobs: %w", err)
 	}
 
+	// 预编译循环中使用的语句，在整个事务内复用，避免每个 job 重复解析 SQL
+	stmts, err := prepareSyncStatements(tx)
+	if err != nil {
+		return err
+	}
+
 	now := time.Now().Unix()
 	addedCount := 0
 	deletedCount := 0
@@ -132,17 +166,14 @@ func (r *JobRepo) SyncJobs(jobNames []string) error {
 
 	// 处理新增的 job
 	for _, jobName := range jobNames {
-		if !r.jobExistsInTx(tx, jobName) {
-			insertQuery := `
-				INSERT INTO jobs(job_name, enabled, last_seen_build, last_sync_time, created_at)
-				VALUES (?, 1, 0, ?, ?)`
-
-			if _, err := tx.Exec(insertQuery, jobName, now, now); err != nil {
+		if !knownJobs[jobName] {
+			if _, err := stmts.insert.Exec(jobName, now, now); err != nil {
 				return fmt.Errorf("failed to insert job %s: %w", jobName, err)
 			}
+			knownJobs[jobName] = true
 
 			// 记录审计日志
-			if err := r.recordJobChange(tx, jobName, "ADD", now); err != nil {
+			if err := recordJobChange(stmts.change, jobName, "ADD", now); err != nil {
 				r.logger.Warn("记录 job 变更审计日志失败",
 					"job_name", jobName,
 					"action", "ADD",
@@ -153,12 +184,7 @@ func (r *JobRepo) SyncJobs(jobNames []string) error {
 			addedCount++
 		} else {
 			// 更新 last_sync_time
-			updateQuery := `
-				UPDATE jobs
-				SET last_sync_time = ?
-				WHERE job_name = ?`
-
-			if _, err := tx.Exec(updateQuery, now, jobName); err != nil {
+			if _, err := stmts.touch.Exec(now, jobName); err != nil {
 				return fmt.Errorf("failed to update last_sync_time for %s: %w", jobName, err)
 			}
 			updatedCount++
@@ -166,21 +192,16 @@ func (r *JobRepo) SyncJobs(jobNames []string) error {
 	}
 
 	// 处理软删除的 job（在数据库中但不在 Jenkins 中）
-	for _, existingJob := range existingJobs {
-		if !jobNameSet[existingJob.JobName] {
-			deleteQuery := `
-				UPDATE jobs
-				SET enabled = 0
-				WHERE job_name = ?`
-
-			if _, err := tx.Exec(deleteQuery, existingJob.JobName); err != nil {
-				return fmt.Errorf("failed to soft delete job %s: %w", existingJob.JobName, err)
+	for _, existingJobName := range existingJobNames {
+		if !jobNameSet[existingJobName] {
+			if _, err := stmts.disable.Exec(existingJobName); err != nil {
+				return fmt.Errorf("failed to soft delete job %s: %w", existingJobName, err)
 			}
 
 			// 记录审计日志
-			if err := r.recordJobChange(tx, existingJob.JobName, "DELETE", now); err != nil {
+			if err := recordJobChange(stmts.change, existingJobName, "DELETE", now); err != nil {
 				r.logger.Warn("记录 job 变更审计日志失败",
-					"job_name", existingJob.JobName,
+					"job_name", existingJobName,
 					"action", "DELETE",
 					"error", err,
 				)
@@ -205,44 +226,81 @@ func (r *JobRepo) SyncJobs(jobNames []string) error {
 	return nil
 }
 
-// listEnabledJobsInTx lists enabled jobs within a transaction.
-func (r *JobRepo) listEnabledJobsInTx(tx *sql.Tx) ([]Job, error) {
-	query := `SELECT job_name FROM jobs WHERE enabled = 1`
+// listJobsInTx scans the jobs table once within a transaction.
+// It returns the set of all known job names and the names of enabled jobs.
+func (r *JobRepo) listJobsInTx(tx *sql.Tx) (map[string]bool, []string, error) {
+	query := `SELECT job_name, enabled FROM jobs`
 
 	rows, err := tx.Query(query)
 	if err != nil {
-		return nil, err
+		return nil, nil, err
 	}
 	defer rows.Close()
 
-	var jobs []Job
+	known := make(map[string]bool)
+	var enabled []string
 	for rows.Next() {
-		var job Job
-		if err := rows.Scan(&job.JobName); err != nil {
-			return nil, err
+		var name string
+		var isEnabled bool
+		if err := rows.Scan(&name, &isEnabled); err != nil {
+			return nil, nil, err
+		}
+		known[name] = true
+		if isEnabled {
+			enabled = append(enabled, name)
 		}
-		jobs = append(jobs, job)
 	}
 
-	return jobs, rows.Err()
+	return known, enabled, rows.Err()
+}
+
+// syncStatements holds the statements prepared once per SyncJobs transaction.
+type syncStatements struct {
+	insert  *sql.Stmt
+	touch   *sql.Stmt
+	disable *sql.Stmt
+	change  *sql.Stmt
 }
 
-// jobExistsInTx checks if a job exists in the database within a transaction.
-func (r *JobRepo) jobExistsInTx(tx *sql.Tx, jobName string) bool {
-	query := `SELECT 1 FROM jobs WHERE job_name = ? LIMIT 1`
+// prepareSyncStatements prepares all statements used by SyncJobs within the transaction.
+// Statements prepared on a transaction are closed when it is committed or rolled back.
+func prepareSyncStatements(tx *sql.Tx) (*syncStatements, error) {
+	stmts := &syncStatements{}
+
+	queries := []struct {
+		stmt  **sql.Stmt
+		query string
+	}{
+		{&stmts.insert, `
+			INSERT INTO jobs(job_name, enabled, last_seen_build, last_sync_time, created_at)
+			VALUES (?, 1, 0, ?, ?)`},
+		{&stmts.touch, `
+			UPDATE jobs
+			SET last_sync_time = ?
+			WHERE job_name = ?`},
+		{&stmts.disable, `
+			UPDATE jobs
+			SET enabled = 0
+			WHERE job_name = ?`},
+		{&stmts.change, `
+			INSERT INTO job_changes(job_name, action, event_time)
+			VALUES (?, ?, ?)`},
+	}
 
-	var exists int
-	err := tx.QueryRow(query, jobName).Scan(&exists)
-	return err == nil
+	for _, q := range queries {
+		stmt, err := tx.Prepare(q.query)
+		if err != nil {
+			return nil, fmt.Errorf("failed to prepare statement: %w", err)
+		}
+		*q.stmt = stmt
+	}
+
+	return stmts, nil
 }
 
 // recordJobChange records a job change event in the audit table.
-func (r *JobRepo) recordJobChange(tx *sql.Tx, jobName, action string, eventTime int64) error {
-	query := `
-		INSERT INTO job_changes(job_name, action, event_time)
-		VALUES (?, ?, ?)`
-
-	_, err := tx.Exec(query, jobName, action, eventTime)
+func recordJobChange(stmt *sql.Stmt, jobName, action string, eventTime int64) error {
+	_, err := stmt.Exec(jobName, action, eventTime)
 	return err
 }
 
@@ -0,0 +1,37 @@
+package storage
+
+import (
+	"io"
+	"log/slog"
+	"path/filepath"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestSyncJobs(t *testing.T) {
+	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
+
+	db, err := NewSQLite(filepath.Join(t.TempDir(), "jobs.db"), logger)
+	require.NoError(t, err)
+	defer db.Close()
+
+	repo := NewJobRepo(db, logger)
+
+	require.NoError(t, repo.SyncJobs([]string{"a", "b", "c"}))
+	require.NoError(t, repo.SyncJobs([]string{"a", "c", "d", "d"}))
+
+	jobs, err := repo.ListEnabledJobs()
+	require.NoError(t, err)
+
+	names := make([]string, 0, len(jobs))
+	for _, job := range jobs {
+		names = append(names, job.JobName)
+	}
+	assert.Equal(t, []string{"a", "c", "d"}, names)
+
+	stats, err := repo.Stats()
+	require.NoError(t, err)
+	assert.Equal(t, JobStats{Total: 4, Enabled: 3, Disabled: 1}, stats)
+}
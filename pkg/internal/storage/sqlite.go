@@ -4,53 +4,91 @@ import (
 	"database/sql"
 	"fmt"
 	"log/slog"
+	"net/url"
+	"strings"
 
 	_ "modernc.org/sqlite" // SQLite driver
 )
 
 // NewSQLite creates and initializes a SQLite database connection.
 func NewSQLite(path string, logger *slog.Logger) (*sql.DB, error) {
-	db, err := sql.Open("sqlite", path)
+	db, err := sql.Open("sqlite", sqliteDSN(path))
 	if err != nil {
 		return nil, fmt.Errorf("failed to open SQLite database: %w", err)
 	}
 
 	// 设置连接池参数（SQLite 推荐单写连接）
+	// 保留一个空闲连接：SQLite 的页缓存和 mmap 绑定在连接上，连接被关闭会丢失已预热的缓存。
+	// database/sql 默认不会按存活时间或空闲时间回收连接，无需额外设置
 	db.SetMaxOpenConns(1)
 	db.SetMaxIdleConns(1)
 
-	// 设置 PRAGMA 优化
-	pragmas := []string{
-		"PRAGMA journal_mode = WAL",
-		"PRAGMA synchronous = NORMAL",
-		"PRAGMA temp_store = MEMORY",
+	// 创建表结构和索引
+	if err := createSchema(db, logger); err != nil {
+		_ = db.Close()
+		return nil, err
 	}
 
-	for _, pragma := range pragmas {
-		if _, err := db.Exec(pragma); err != nil {
-			return nil, fmt.Errorf("failed to set PRAGMA %s: %w", pragma, err)
-		}
+	logger.Info("SQLite 数据库初始化完成",
+		"路径", path,
+	)
+
+	return db, nil
+}
+
+// sqlitePragmas are applied by the driver to every new connection, so they
+// survive the pool replacing a connection. Most of them are per-connection.
+var sqlitePragmas = []string{
+	"journal_mode(WAL)",
+	"synchronous(NORMAL)",
+	"temp_store(MEMORY)",
+	"cache_size(-64000)",   // 约 64MB 页缓存
+	"mmap_size(268435456)", // 256MB 内存映射读取
+}
+
+// sqliteDSN appends the PRAGMA settings to the database path as _pragma parameters.
+func sqliteDSN(path string) string {
+	params := url.Values{}
+	for _, pragma := range sqlitePragmas {
+		params.Add("_pragma", pragma)
+	}
+
+	sep := "?"
+	if strings.Contains(path, "?") {
+		sep = "&"
 	}
 
+	return path + sep + params.Encode()
+}
+
+// createSchema creates all tables and indexes within a single transaction,
+// so the schema bootstrap costs one commit instead of one per statement.
+func createSchema(db *sql.DB, logger *slog.Logger) error {
+	tx, err := db.Begin()
+	if err != nil {
+		return fmt.Errorf("failed to begin schema transaction: %w", err)
+	}
+	defer tx.Rollback()
+
 	// 创建表结构
-	if err := createTables(db, logger); err != nil {
-		return nil, fmt.Errorf("failed to create tables: %w", err)
+	if err := createTables(tx, logger); err != nil {
+		return fmt.Errorf("failed to create tables: %w", err)
 	}
 
 	// 创建索引
-	if err := createIndexes(db, logger); err != nil {
-		return nil, fmt.Errorf("failed to create indexes: %w", err)
+	if err := createIndexes(tx, logger); err != nil {
+		return fmt.Errorf("failed to create indexes: %w", err)
 	}
 
-	logger.Info("SQLite 数据库初始化完成",
-		"路径", path,
-	)
+	if err := tx.Commit(); err != nil {
+		return fmt.Errorf("failed to commit schema transaction: %w", err)
+	}
 
-	return db, nil
+	return nil
 }
 
 // createTables creates the required database tables.
-func createTables(db *sql.DB, logger *slog.Logger) error {
+func createTables(tx *sql.Tx, logger *slog.Logger) error {
 	// 创建 jobs 表
 	jobsTable := `
 	CREATE TABLE IF NOT EXISTS jobs (
@@ -61,7 +99,7 @@ func createTables(db *sql.DB, logger *slog.Logger) error {
 		created_at      INTEGER NOT NULL
 	);`
 
-	if _, err := db.Exec(jobsTable); err != nil {
+	if _, err := tx.Exec(jobsTable); err != nil {
 		return fmt.Errorf("failed to create jobs table: %w", err)
 	}
 
@@ -73,7 +111,7 @@ func createTables(db *sql.DB, logger *slog.Logger) error {
 		event_time INTEGER
 	);`
 
-	if _, err := db.Exec(jobChangesTable); err != nil {
+	if _, err := tx.Exec(jobChangesTable); err != nil {
 		return fmt.Errorf("failed to create job_changes table: %w", err)
 	}
 
@@ -82,16 +120,18 @@ func createTables(db *sql.DB, logger *slog.Logger) error {
 }
 
 // createIndexes creates the required database indexes.
-func createIndexes(db *sql.DB, logger *slog.Logger) error {
+func createIndexes(tx *sql.Tx, logger *slog.Logger) error {
 	indexes := []string{
-		"CREATE INDEX IF NOT EXISTS idx_jobs_enabled ON jobs(enabled)",
+		// idx_jobs_enabled(enabled) 是 idx_jobs_enabled_name 的前缀，属于冗余索引，旧库中删除以减少写放大
+		"DROP INDEX IF EXISTS idx_jobs_enabled",
 		"CREATE INDEX IF NOT EXISTS idx_jobs_enabled_lastseen ON jobs(enabled, last_seen_build)",
+		"CREATE INDEX IF NOT EXISTS idx_jobs_enabled_name ON jobs(enabled, job_name)", // ListEnabledJobs 按 job_name 排序，避免临时 B-TREE 排序
 		"CREATE INDEX IF NOT EXISTS idx_jobs_last_sync_time ON jobs(last_sync_time)",
 		"CREATE INDEX IF NOT EXISTS idx_job_changes_time ON job_changes(event_time)",
 	}
 
 	for _, index := range indexes {
-		if _, err := db.Exec(index); err != nil {
+		if _, err := tx.Exec(index); err != nil {
 			return fmt.Errorf("failed to create index: %w", err)
 		}
 	}
@@ -0,0 +1,81 @@
+package storage
+
+import (
+	"database/sql"
+	"io"
+	"log/slog"
+	"path/filepath"
+	"strings"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestListEnabledJobsUsesIndexOrder(t *testing.T) {
+	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
+
+	db, err := NewSQLite(filepath.Join(t.TempDir(), "jobs.db"), logger)
+	require.NoError(t, err)
+	defer db.Close()
+
+	rows, err := db.Query("EXPLAIN QUERY PLAN " + listEnabledJobsQuery)
+	require.NoError(t, err)
+	defer rows.Close()
+
+	var plan []string
+	for rows.Next() {
+		var id, parent, notused int
+		var detail sql.NullString
+		require.NoError(t, rows.Scan(&id, &parent, &notused, &detail))
+		plan = append(plan, detail.String)
+	}
+	require.NoError(t, rows.Err())
+
+	joined := strings.Join(plan, "\n")
+	assert.Contains(t, joined, "idx_jobs_enabled_name")
+	assert.NotContains(t, joined, "USE TEMP B-TREE FOR ORDER BY")
+}
+
+func TestPragmasApplyToNewConnections(t *testing.T) {
+	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
+
+	db, err := NewSQLite(filepath.Join(t.TempDir(), "jobs.db"), logger)
+	require.NoError(t, err)
+	defer db.Close()
+
+	// 关闭空闲连接，强制下一次查询使用新建的连接
+	db.SetMaxIdleConns(0)
+
+	var cacheSize, synchronous, tempStore int
+	require.NoError(t, db.QueryRow("PRAGMA cache_size").Scan(&cacheSize))
+	require.NoError(t, db.QueryRow("PRAGMA synchronous").Scan(&synchronous))
+	require.NoError(t, db.QueryRow("PRAGMA temp_store").Scan(&tempStore))
+
+	assert.Equal(t, -64000, cacheSize)
+	assert.Equal(t, 1, synchronous) // NORMAL
+	assert.Equal(t, 2, tempStore)   // MEMORY
+}
+
+func TestRedundantEnabledIndexIsDropped(t *testing.T) {
+	logger := slog.New(slog.NewTextHandler(io.Discard, nil))
+	path := filepath.Join(t.TempDir(), "jobs.db")
+
+	db, err := NewSQLite(path, logger)
+	require.NoError(t, err)
+
+	// 模拟旧版本创建的索引
+	_, err = db.Exec("CREATE INDEX idx_jobs_enabled ON jobs(enabled)")
+	require.NoError(t, err)
+	require.NoError(t, db.Close())
+
+	db, err = NewSQLite(path, logger)
+	require.NoError(t, err)
+	defer db.Close()
+
+	var count int
+	require.NoError(t, db.QueryRow(
+		"SELECT COUNT(*) FROM sqlite_master WHERE type = 'index' AND name = 'idx_jobs_enabled'",
+	).Scan(&count))
+	assert.Zero(t, count)
+}